@@ -1,9 +1,16 @@
+import asyncio
+import contextlib
 import logging
+import os
+import time
 
-from typing import Any
-from uuid import uuid4
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, cast
 
 import httpx
+import orjson
 import socketio
 import validators
 
@@ -14,33 +21,92 @@ from a2a.types import (
     Message,
     MessageSendConfiguration,
     MessageSendParams,
+    Part,
     Role,
     SendMessageRequest,
     SendMessageResponse,
     SendStreamingMessageRequest,
     SendStreamingMessageResponse,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
     TextPart,
 )
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
 
 
 # ==============================================================================
 # Setup
 # ==============================================================================
 
+log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.getLevelNamesMapping().get(log_level, logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
 )
 logger = logging.getLogger(__name__)
+if log_level not in logging.getLevelNamesMapping():
+    logger.warning(f'Unknown LOG_LEVEL {log_level!r}, using INFO.')
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage the shared HTTP client used by the FastAPI routes.
+
+    A single client is kept for the lifetime of the application so that
+    connections to agent hosts are pooled and reused across requests.
+    """
+    app.state.http_client = httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=30.0,
+        ),
+    )
+    yield
+    await app.state.http_client.aclose()
+    if closing_clients:
+        await asyncio.gather(*closing_clients, return_exceptions=True)
+
+
+class _OrjsonCodec:
+    """JSON module replacement for python-socketio backed by orjson.
+
+    python-socketio calls `dumps` with stdlib-style keyword arguments and
+    expects a `str` back, so orjson is wrapped rather than passed directly.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **_: Any) -> str:
+        """Serialize `obj` to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data: str | bytes, **_: Any) -> Any:
+        """Deserialize a JSON document."""
+        return orjson.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes."""
+        return orjson.dumps(content)
+
+
+app = FastAPI(lifespan=lifespan)
 # NOTE: In a production environment, cors_allowed_origins should be restricted
 # to the specific frontend domain, not a wildcard '*'.
-sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
+sio = socketio.AsyncServer(
+    async_mode='asgi', cors_allowed_origins='*', json=_OrjsonCodec
+)
 socket_app = socketio.ASGIApp(sio)
 app.mount('/socket.io', socket_app)
 
@@ -51,10 +117,151 @@ templates = Jinja2Templates(directory='../frontend/public')
 # State Management
 # ==============================================================================
 
+
+@dataclass(frozen=True, slots=True)
+class ClientCtx:
+    """Per-connection A2A client state, built once in 'initialize_client'."""
+
+    httpx_client: httpx.AsyncClient
+    a2a_client: A2AClient
+    card: AgentCard
+    supports_streaming: bool
+
+
+# Every message is sent with the same configuration. Requests only read it, so
+# a single instance is shared.
+DEFAULT_SEND_CONFIGURATION = MessageSendConfiguration(
+    acceptedOutputModes=['text/plain', 'video/mp4']
+)
+
 # NOTE: This global dictionary stores state. For a simple inspector tool with
 # transient connections, this is acceptable. For a scalable production service,
 # a more robust state management solution (e.g., Redis) would be required.
-clients: dict[str, tuple[httpx.AsyncClient, A2AClient, AgentCard]] = {}
+clients: dict[str, ClientCtx] = {}
+# HTTP clients of disconnected sockets that are still being closed. Strong
+# references keep the tasks alive until they finish.
+closing_clients: set[asyncio.Task[None]] = set()
+# 'send_message' handlers still running for each client, so they can be
+# cancelled when the client disconnects.
+active_sends: dict[str, set[asyncio.Task[Any]]] = {}
+
+# Outgoing Socket.IO events are buffered per client and flushed as a single
+# 'batch' event, so that bursts of small events share one WebSocket frame.
+BATCH_WINDOW_SECONDS = 0.005
+BATCH_MAX_EVENTS = 32
+BATCH_MAX_BYTES = 64 * 1024
+# The client acknowledges every batch. Once this many batches are awaiting
+# acknowledgement the pump stops sending, the outbox fills up to
+# OUTBOX_MAX_EVENTS and producers wait, so a slow client throttles the agent
+# stream feeding it instead of buffering without limit.
+MAX_UNACKED_BATCHES = 4
+OUTBOX_MAX_EVENTS = 64
+# A batch not acknowledged within this time is written off, so that a client
+# which stops acknowledging slows its session down instead of stalling it.
+BATCH_ACK_TIMEOUT_SECONDS = 5.0
+# Intermediate status updates without a message only report state churn and
+# render nothing in the chat, so one is held back this long in case a newer
+# one replaces it.
+STATUS_COALESCE_SECONDS = 0.016
+
+
+@dataclass
+class Outbox:
+    """Encoded events waiting to be sent to a client."""
+
+    queue: asyncio.Queue[bytes] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=OUTBOX_MAX_EVENTS)
+    )
+    flush_requested: asyncio.Event = field(default_factory=asyncio.Event)
+    unacked_batches: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_UNACKED_BATCHES)
+    )
+    pump: asyncio.Task[None] | None = None
+    held_status: bytes | None = None
+    held_status_timer: asyncio.TimerHandle | None = None
+
+
+outboxes: dict[str, Outbox] = {}
+
+# Clients whose debug console is open. Other clients only get the request logs
+# that the chat view needs.
+debug_subscribers: set[str] = set()
+
+# Recently fetched agent cards, keyed by agent URL, so that 'initialize_client'
+# can reuse the card that '/agent-card' fetched moments before. Entries are
+# kept in fetch order; expired ones, and the oldest beyond AGENT_CARD_CACHE_SIZE,
+# are dropped whenever a card is stored.
+AGENT_CARD_TTL_SECONDS = 300.0
+AGENT_CARD_CACHE_SIZE = 256
+agent_cards: dict[str, tuple[float, AgentCard]] = {}
+# Card fetches currently in flight, so that concurrent requests for the same
+# URL share a single upstream request.
+agent_card_fetches: dict[str, asyncio.Task[AgentCard]] = {}
+
+
+# ==============================================================================
+# Agent Card Helpers
+# ==============================================================================
+
+
+def _remember_agent_card(agent_url: str, card: AgentCard) -> None:
+    """Store a fetched agent card and prune stale entries from the cache."""
+    now = time.monotonic()
+    # Re-inserting keeps the dict ordered by fetch time, oldest first.
+    agent_cards.pop(agent_url, None)
+    agent_cards[agent_url] = (now, card)
+    for url, (fetched_at, _) in list(agent_cards.items()):
+        if (
+            now - fetched_at < AGENT_CARD_TTL_SECONDS
+            and len(agent_cards) <= AGENT_CARD_CACHE_SIZE
+        ):
+            break
+        del agent_cards[url]
+
+
+def _retrieve_fetch_exception(fetch: asyncio.Task[AgentCard]) -> None:
+    """Mark a failed card fetch's exception as retrieved.
+
+    Every caller may have been cancelled before the fetch failed, in which
+    case nothing else reads it and asyncio would report it as never retrieved.
+    """
+    if not fetch.cancelled():
+        fetch.exception()
+
+
+async def _fetch_agent_card(agent_url: str) -> AgentCard:
+    """Fetch an agent card and remember it for later lookups.
+
+    If a fetch of the same URL is already in flight, its result is shared
+    instead of issuing another request. Fetches use the application-wide
+    HTTP client, since they can outlive the client that started them.
+    """
+    fetch = agent_card_fetches.get(agent_url)
+    if fetch is None:
+        fetch = asyncio.create_task(
+            A2ACardResolver(app.state.http_client, agent_url).get_agent_card()
+        )
+        agent_card_fetches[agent_url] = fetch
+        fetch.add_done_callback(
+            lambda _: agent_card_fetches.pop(agent_url, None)
+        )
+        fetch.add_done_callback(_retrieve_fetch_exception)
+    # Shielded so that one cancelled caller does not abort the fetch for the
+    # others waiting on it.
+    card = await asyncio.shield(fetch)
+    _remember_agent_card(agent_url, card)
+    return card
+
+
+async def _get_agent_card(agent_url: str) -> AgentCard:
+    """Return a recently fetched agent card, fetching it if needed."""
+    cached = agent_cards.get(agent_url)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < AGENT_CARD_TTL_SECONDS
+    ):
+        return cached[1]
+    return await _fetch_agent_card(agent_url)
 
 
 # ==============================================================================
@@ -62,15 +269,189 @@ clients: dict[str, tuple[httpx.AsyncClient, A2AClient, AgentCard]] = {}
 # ==============================================================================
 
 
+def _model_json(model: BaseModel) -> bytes:
+    """Serialize a pydantic model to JSON, omitting unset optional fields.
+
+    The model's core serializer is called directly, skipping the argument
+    handling `model_dump_json` repeats on every call.
+    """
+    return model.__pydantic_serializer__.to_json(model, exclude_none=True)
+
+
+def _new_id() -> str:
+    """Return a random 128-bit hex identifier.
+
+    Same shape as `uuid4().hex`, without building a UUID object.
+    """
+    return os.urandom(16).hex()
+
+
+def _dump_model(model: BaseModel) -> dict[str, Any]:
+    """Convert a pydantic model into a JSON-compatible dict."""
+    return model.model_dump(mode='json', exclude_none=True)
+
+
+async def _queue_event(sid: str, event: str, data: Any) -> None:
+    """Queue an event for delivery in the client's next batch.
+
+    Events are encoded as soon as they are queued so that the outbox pump can
+    bound batches by size without serializing anything twice. Each one is
+    encoded as an `[event, data]` pair rather than an object.
+    """
+    outbox = outboxes.get(sid)
+    if outbox is None:
+        # The client has already disconnected.
+        return
+    held = outbox.held_status
+    if held is not None:
+        # A held status update precedes whatever is queued after it.
+        outbox.held_status = None
+        if outbox.held_status_timer is not None:
+            outbox.held_status_timer.cancel()
+            outbox.held_status_timer = None
+        await outbox.queue.put(held)
+    await outbox.queue.put(orjson.dumps((event, data)))
+
+
+def _hold_status(sid: str, data: Any) -> None:
+    """Queue an intermediate status update after STATUS_COALESCE_SECONDS.
+
+    A status update still held when the next one arrives is replaced by it.
+    """
+    outbox = outboxes.get(sid)
+    if outbox is None:
+        return
+    outbox.held_status = orjson.dumps(('agent_response', data))
+    if outbox.held_status_timer is None:
+        outbox.held_status_timer = asyncio.get_running_loop().call_later(
+            STATUS_COALESCE_SECONDS, _release_held_status, outbox
+        )
+
+
+def _release_held_status(outbox: Outbox) -> None:
+    """Move a held status update onto the outbox queue."""
+    outbox.held_status_timer = None
+    if outbox.held_status is None:
+        return
+    try:
+        outbox.queue.put_nowait(outbox.held_status)
+    except asyncio.QueueFull:
+        # Try again once the pump has made room.
+        outbox.held_status_timer = asyncio.get_running_loop().call_later(
+            STATUS_COALESCE_SECONDS, _release_held_status, outbox
+        )
+        return
+    outbox.held_status = None
+
+
+def _flush_outbox(sid: str) -> None:
+    """Send the client's queued events without waiting for the batch window."""
+    outbox = outboxes.get(sid)
+    # With nothing queued, a request would linger and cut the window of the
+    # next, unrelated batch short.
+    if outbox is not None and not outbox.queue.empty():
+        outbox.flush_requested.set()
+
+
+async def _pump_outbox(sid: str, outbox: Outbox) -> None:
+    """Flush queued events to the client as 'batch' events.
+
+    Each batch collects what is queued within BATCH_WINDOW_SECONDS of its first
+    event, or until a flush is requested, up to BATCH_MAX_EVENTS events and
+    BATCH_MAX_BYTES of encoded payload. At most MAX_UNACKED_BATCHES batches are
+    sent ahead of the client's acknowledgements, and a batch still awaiting
+    one after BATCH_ACK_TIMEOUT_SECONDS no longer counts towards that limit.
+    """
+    queue = outbox.queue
+    unacked_batches = outbox.unacked_batches
+    # Batches given up on whose acknowledgement may still arrive late.
+    written_off = 0
+
+    def on_ack(*_: Any) -> None:
+        nonlocal written_off
+        if written_off:
+            written_off -= 1
+        else:
+            unacked_batches.release()
+
+    while True:
+        try:
+            async with asyncio.timeout(BATCH_ACK_TIMEOUT_SECONDS):
+                await unacked_batches.acquire()
+        except TimeoutError:
+            logger.warning(
+                f'Client {sid} has not acknowledged a batch in '
+                f'{BATCH_ACK_TIMEOUT_SECONDS}s, sending anyway.'
+            )
+            written_off += 1
+        batch = [await queue.get()]
+        size = len(batch[0])
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                outbox.flush_requested.wait(), BATCH_WINDOW_SECONDS
+            )
+        outbox.flush_requested.clear()
+        while (
+            len(batch) < BATCH_MAX_EVENTS
+            and size < BATCH_MAX_BYTES
+            and not queue.empty()
+        ):
+            encoded = queue.get_nowait()
+            batch.append(encoded)
+            size += len(encoded)
+        await sio.emit(
+            'batch',
+            [orjson.Fragment(encoded) for encoded in batch],
+            to=sid,
+            callback=on_ack,
+        )
+
+
 async def _emit_debug_log(
-    sid: str, event_id: str, log_type: str, data: Any
+    sid: str,
+    event_id: str,
+    log_type: str,
+    data: Any,
+    *,
+    always: bool = False,
 ) -> None:
-    """Helper to emit a structured debug log event to the client."""
-    await sio.emit(
-        'debug_log', {'type': log_type, 'data': data, 'id': event_id}, to=sid
+    """Helper to emit a structured debug log event to the client.
+
+    Logs are only sent to clients with the debug console open, unless `always`
+    is set for logs the client needs for other purposes.
+    """
+    if not always and sid not in debug_subscribers:
+        return
+    await _queue_event(
+        sid, 'debug_log', {'type': log_type, 'data': data, 'id': event_id}
     )
 
 
+# Event types whose payload has its own 'id' field, decided once from the
+# model definitions rather than probed on every response.
+_EVENT_TYPES_WITH_ID = frozenset(
+    cls
+    for cls in (Task, Message, TaskStatusUpdateEvent, TaskArtifactUpdateEvent)
+    if 'id' in cls.model_fields
+)
+
+
+def _is_final_event(
+    event: Task | Message | TaskStatusUpdateEvent | TaskArtifactUpdateEvent,
+) -> bool:
+    """Return whether an event concludes the update it belongs to.
+
+    Status updates are final only when flagged as such, and artifact updates
+    when they carry the last (or only) chunk of an artifact. Tasks and
+    messages are complete snapshots and are always final.
+    """
+    if isinstance(event, TaskStatusUpdateEvent):
+        return event.final
+    if isinstance(event, TaskArtifactUpdateEvent):
+        return event.lastChunk is not False
+    return True
+
+
 async def _process_a2a_response(
     result: SendMessageResponse | SendStreamingMessageResponse,
     sid: str,
@@ -78,36 +459,65 @@ async def _process_a2a_response(
 ) -> None:
     """Processes a response from the A2A client, validates it, and emits events.
 
-    Handles both success and error responses.
+    Handles both success and error responses. Events are only queued on the
+    client's outbox, so the caller can read the next streamed result while
+    the outbox pump writes this one to the socket.
     """
-    if isinstance(result.root, JSONRPCErrorResponse):
-        error_data = result.root.error.model_dump(exclude_none=True)
+    # An exact type check is cheaper than isinstance for this hot path; the
+    # response models are never subclassed.
+    root = result.root
+    if type(root) is JSONRPCErrorResponse:
+        error_data = _dump_model(root.error)
         await _emit_debug_log(sid, request_id, 'error', error_data)
-        await sio.emit(
+        await _queue_event(
+            sid,
             'agent_response',
             {
                 'error': error_data.get('message', 'Unknown error'),
                 'id': request_id,
             },
-            to=sid,
         )
         return
 
     # Success case
-    event = result.root.result
+    event = root.result  # type: ignore[union-attr]
     # The response payload 'event' (Task, Message, etc.) may have its own 'id',
     # which can differ from the JSON-RPC request/response 'id'. We prioritize
     # the payload's ID for client-side correlation if it exists.
-    response_id = getattr(event, 'id', request_id)
-
-    response_data = event.model_dump(exclude_none=True)
-    response_data['id'] = response_id
-
-    validation_errors = validators.validate_message(response_data)
-    response_data['validation_errors'] = validation_errors
+    response_id = (
+        event.id  # type: ignore[union-attr]
+        if type(event) in _EVENT_TYPES_WITH_ID
+        else request_id
+    )
 
-    await _emit_debug_log(sid, response_id, 'response', response_data)
-    await sio.emit('agent_response', response_data, to=sid)
+    # The event is serialized once, straight to JSON, and embedded verbatim in
+    # the outgoing payload. Validation works on the event model itself.
+    # Intermediate streaming chunks are not validated, only the events that
+    # conclude an update. Both run inline: pydantic-core holds the GIL while
+    # serializing, so a worker thread would stall the loop just as long.
+    raw_event = _model_json(event)
+    validation_errors: Sequence[str] = ()
+    if _is_final_event(event):
+        validation_errors = validators.validate_event(event)
+
+    # The event is sent to the client only once: the debug console derives its
+    # 'response' entry from the agent_response event instead of a debug_log.
+    response_data = {
+        'id': response_id,
+        'validation_errors': validation_errors,
+        'result': orjson.Fragment(raw_event),
+    }
+    # Clients with the debug console open see every event in the raw stream,
+    # so only the others get coalesced status updates.
+    if (
+        type(event) is TaskStatusUpdateEvent
+        and not event.final
+        and event.status.message is None
+        and sid not in debug_subscribers
+    ):
+        _hold_status(sid, response_data)
+    else:
+        await _queue_event(sid, 'agent_response', response_data)
 
 
 # ==============================================================================
@@ -122,7 +532,7 @@ async def index(request: Request) -> HTMLResponse:
 
 
 @app.post('/agent-card')
-async def get_agent_card(request: Request) -> JSONResponse:
+async def get_agent_card(request: Request) -> ORJSONResponse:
     """Fetch and validate the agent card from a given URL."""
     # 1. Parse request and get sid. If this fails, we can't do much.
     try:
@@ -131,13 +541,18 @@ async def get_agent_card(request: Request) -> JSONResponse:
         sid = request_data.get('sid')
 
         if not agent_url or not sid:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={'error': 'Agent URL and SID are required.'},
                 status_code=400,
             )
+        if not validators.is_valid_agent_url(agent_url):
+            return ORJSONResponse(
+                content={'error': 'Agent URL must be an http(s) URL.'},
+                status_code=400,
+            )
     except Exception:
         logger.warning('Failed to parse JSON from /agent-card request.')
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': 'Invalid request body.'}, status_code=400
         )
 
@@ -151,11 +566,9 @@ async def get_agent_card(request: Request) -> JSONResponse:
 
     # 3. Perform the main action and prepare response.
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            card_resolver = A2ACardResolver(client, agent_url)
-            card = await card_resolver.get_agent_card()
+        card = await _fetch_agent_card(agent_url)
 
-        card_data = card.model_dump(exclude_none=True)
+        card_data = _dump_model(card)
         validation_errors = validators.validate_agent_card(card_data)
         response_data = {
             'card': card_data,
@@ -164,13 +577,11 @@ async def get_agent_card(request: Request) -> JSONResponse:
         response_status = 200
 
     except httpx.RequestError as e:
-        logger.error(
-            f'Failed to connect to agent at {agent_url}', exc_info=True
-        )
+        logger.exception(f'Failed to connect to agent at {agent_url}')
         response_data = {'error': f'Failed to connect to agent: {e}'}
         response_status = 502  # Bad Gateway
     except Exception as e:
-        logger.error('An internal server error occurred', exc_info=True)
+        logger.exception('An internal server error occurred')
         response_data = {'error': f'An internal server error occurred: {e}'}
         response_status = 500
 
@@ -181,7 +592,7 @@ async def get_agent_card(request: Request) -> JSONResponse:
         'response',
         {'status': response_status, 'payload': response_data},
     )
-    return JSONResponse(content=response_data, status_code=response_status)
+    return ORJSONResponse(content=response_data, status_code=response_status)
 
 
 # ==============================================================================
@@ -193,42 +604,95 @@ async def get_agent_card(request: Request) -> JSONResponse:
 async def handle_connect(sid: str, environ: dict[str, Any]) -> None:
     """Handle the 'connect' socket.io event."""
     logger.info(f'Client connected: {sid}, environment: {environ}')
+    outbox = Outbox()
+    outbox.pump = asyncio.create_task(_pump_outbox(sid, outbox))
+    outboxes[sid] = outbox
 
 
 @sio.on('disconnect')
 async def handle_disconnect(sid: str) -> None:
     """Handle the 'disconnect' socket.io event."""
     logger.info(f'Client disconnected: {sid}')
-    if sid in clients:
-        httpx_client, _, _ = clients.pop(sid)
-        await httpx_client.aclose()
+    debug_subscribers.discard(sid)
+    # Stop relaying agent streams nobody is listening to any more.
+    for task in active_sends.pop(sid, ()):
+        task.cancel()
+    outbox = outboxes.pop(sid, None)
+    if outbox is not None:
+        if outbox.pump is not None:
+            outbox.pump.cancel()
+        if outbox.held_status_timer is not None:
+            outbox.held_status_timer.cancel()
+        # Release any producer waiting on a full queue; later events for this
+        # client are dropped by _queue_event.
+        while not outbox.queue.empty():
+            outbox.queue.get_nowait()
+    ctx = clients.pop(sid, None)
+    if ctx is not None:
+        # Closing the client can wait on the network, so it is done in the
+        # background rather than holding up the disconnect handler.
+        task = asyncio.create_task(ctx.httpx_client.aclose())
+        closing_clients.add(task)
+        task.add_done_callback(closing_clients.discard)
         logger.info(f'Cleaned up client for {sid}')
 
 
+@sio.on('enable_debug')
+async def handle_enable_debug(sid: str, data: dict[str, Any]) -> None:
+    """Handle the 'enable_debug' socket.io event."""
+    if data.get('enabled'):
+        debug_subscribers.add(sid)
+    else:
+        debug_subscribers.discard(sid)
+
+
 @sio.on('initialize_client')
 async def handle_initialize_client(sid: str, data: dict[str, Any]) -> None:
     """Handle the 'initialize_client' socket.io event."""
     agent_url = data.get('url')
     if not agent_url:
-        await sio.emit(
+        await _queue_event(
+            sid,
             'client_initialized',
             {'status': 'error', 'message': 'Agent URL is required.'},
-            to=sid,
+        )
+        return
+    if not validators.is_valid_agent_url(agent_url):
+        await _queue_event(
+            sid,
+            'client_initialized',
+            {'status': 'error', 'message': 'Agent URL must be an http(s) URL.'},
         )
         return
     try:
-        httpx_client = httpx.AsyncClient(timeout=600.0)
-        card_resolver = A2ACardResolver(httpx_client, str(agent_url))
-        card = await card_resolver.get_agent_card()
+        card = await _get_agent_card(str(agent_url))
+        # Sessions are long-lived and stream responses, so HTTP/2 is offered
+        # to multiplex requests over one connection (agents without it fall
+        # back to HTTP/1.1), and reads may take up to 10 minutes.
+        httpx_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=10.0, read=600.0, write=60.0, pool=5.0
+            ),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=120.0,
+            ),
+        )
         a2a_client = A2AClient(httpx_client, agent_card=card)
-        clients[sid] = (httpx_client, a2a_client, card)
-        await sio.emit('client_initialized', {'status': 'success'}, to=sid)
-    except Exception as e:
-        logger.error(
-            f'Failed to initialize client for {sid}: {e}', exc_info=True
+        clients[sid] = ClientCtx(
+            httpx_client=httpx_client,
+            a2a_client=a2a_client,
+            card=card,
+            # 'streaming' is an optional field of AgentCapabilities.
+            supports_streaming=card.capabilities.streaming is True,
         )
-        await sio.emit(
-            'client_initialized', {'status': 'error', 'message': str(e)}, to=sid
+        await _queue_event(sid, 'client_initialized', {'status': 'success'})
+    except Exception as e:
+        logger.exception(f'Failed to initialize client for {sid}: {e}')
+        await _queue_event(
+            sid, 'client_initialized', {'status': 'error', 'message': str(e)}
         )
 
 
@@ -236,54 +700,62 @@ async def handle_initialize_client(sid: str, data: dict[str, Any]) -> None:
 async def handle_send_message(sid: str, json_data: dict[str, Any]) -> None:
     """Handle the 'send_message' socket.io event."""
     message_text = json_data.get('message')
-    message_id = json_data.get('id', str(uuid4()))
+    message_id = json_data.get('id') or _new_id()
 
     if sid not in clients:
-        await sio.emit(
+        await _queue_event(
+            sid,
             'agent_response',
             {'error': 'Client not initialized.', 'id': message_id},
-            to=sid,
         )
         return
 
-    _, a2a_client, card = clients[sid]
+    ctx = clients[sid]
 
-    message = Message(
+    # The request is assembled with model_construct to skip validation: every
+    # field is set by the server, except the text, which is coerced to a str.
+    message = Message.model_construct(
         role=Role.user,
-        parts=[TextPart(text=str(message_text))],  # type: ignore[list-item]
-        messageId=str(uuid4()),
-    )
-    payload = MessageSendParams(
-        message=message,
-        configuration=MessageSendConfiguration(
-            acceptedOutputModes=['text/plain', 'video/mp4']
-        ),
+        parts=[
+            Part.model_construct(
+                root=TextPart.model_construct(text=str(message_text))
+            )
+        ],
+        messageId=_new_id(),
     )
-
-    supports_streaming = (
-        hasattr(card.capabilities, 'streaming')
-        and card.capabilities.streaming is True
+    payload = MessageSendParams.model_construct(
+        message=message, configuration=DEFAULT_SEND_CONFIGURATION
     )
 
+    # python-socketio runs every event handler in its own task.
+    task = cast('asyncio.Task[Any]', asyncio.current_task())
+    sends = active_sends.setdefault(sid, set())
+    sends.add(task)
     try:
-        if supports_streaming:
-            stream_request = SendStreamingMessageRequest(
+        if ctx.supports_streaming:
+            stream_request = SendStreamingMessageRequest.model_construct(
                 id=message_id,
                 method='message/stream',
                 jsonrpc='2.0',
                 params=payload,
             )
+            # Request logs are always sent: clicking a user message in the chat
+            # opens its request JSON.
             await _emit_debug_log(
                 sid,
                 message_id,
                 'request',
-                stream_request.model_dump(exclude_none=True),
+                _dump_model(stream_request),
+                always=True,
+            )
+            response_stream = ctx.a2a_client.send_message_streaming(
+                stream_request
             )
-            response_stream = a2a_client.send_message_streaming(stream_request)
             async for stream_result in response_stream:
                 await _process_a2a_response(stream_result, sid, message_id)
+            _flush_outbox(sid)
         else:
-            send_message_request = SendMessageRequest(
+            send_message_request = SendMessageRequest.model_construct(
                 id=message_id,
                 method='message/send',
                 jsonrpc='2.0',
@@ -293,18 +765,26 @@ async def handle_send_message(sid: str, json_data: dict[str, Any]) -> None:
                 sid,
                 message_id,
                 'request',
-                send_message_request.model_dump(exclude_none=True),
+                _dump_model(send_message_request),
+                always=True,
+            )
+            send_result = await ctx.a2a_client.send_message(
+                send_message_request
             )
-            send_result = await a2a_client.send_message(send_message_request)
             await _process_a2a_response(send_result, sid, message_id)
+            _flush_outbox(sid)
 
     except Exception as e:
-        logger.error(f'Failed to send message for sid {sid}', exc_info=True)
-        await sio.emit(
+        logger.exception(f'Failed to send message for sid {sid}')
+        await _queue_event(
+            sid,
             'agent_response',
             {'error': f'Failed to send message: {e}', 'id': message_id},
-            to=sid,
         )
+    finally:
+        sends.discard(task)
+        if not sends and active_sends.get(sid) is sends:
+            del active_sends[sid]
 
 
 # ==============================================================================
@@ -317,4 +797,7 @@ if __name__ == '__main__':
 
     # NOTE: The 'reload=True' flag is for development purposes only.
     # In a production environment, use a proper process manager like Gunicorn.
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    # (they come with uvicorn[standard]). Run a single worker: client sessions
+    # live in this process, so Socket.IO events cannot be served elsewhere.
     uvicorn.run('app:app', host='127.0.0.1', port=5001, reload=True)
@@ -1,33 +1,62 @@
+from collections.abc import Callable, Sequence
 from typing import Any
+from urllib.parse import urlsplit
+
+from a2a.types import (
+    Message,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
+)
+
+
+# Returned by the message validators when an event is valid, so the common
+# case does not allocate.
+_NO_ERRORS: tuple[str, ...] = ()
+
+_REQUIRED_CARD_FIELDS = frozenset(
+    [
+        'name',
+        'description',
+        'url',
+        'version',
+        'capabilities',
+        'defaultInputModes',
+        'defaultOutputModes',
+        'skills',
+    ]
+)
+_AGENT_CARD_URL_SCHEMES = ('http://', 'https://')
+_AGENT_CARD_MODE_FIELDS = ('defaultInputModes', 'defaultOutputModes')
+# Bound isinstance check, so element checks run in C via map().
+_is_str = str.__instancecheck__
+
+
+def is_valid_agent_url(url: Any) -> bool:
+    """Check that an agent URL is an absolute http(s) URL with a host."""
+    if not isinstance(url, str):
+        return False
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ('http', 'https') and bool(parts.hostname)
 
 
 def validate_agent_card(card_data: dict[str, Any]) -> list[str]:
     """Validate the structure and fields of an agent card."""
     errors: list[str] = []
 
-    # Use a frozenset for efficient checking and to indicate immutability.
-    required_fields = frozenset(
-        [
-            'name',
-            'description',
-            'url',
-            'version',
-            'capabilities',
-            'defaultInputModes',
-            'defaultOutputModes',
-            'skills',
-        ]
-    )
-
     # Check for the presence of all required fields
-    for field in required_fields:
-        if field not in card_data:
-            errors.append(f"Required field is missing: '{field}'.")
+    errors.extend(
+        f"Required field is missing: '{field}'."
+        for field in sorted(_REQUIRED_CARD_FIELDS.difference(card_data))
+    )
 
     # Check if 'url' is an absolute URL (basic check)
-    if 'url' in card_data and not (
-        card_data['url'].startswith('http://')
-        or card_data['url'].startswith('https://')
+    if 'url' in card_data and not card_data['url'].startswith(
+        _AGENT_CARD_URL_SCHEMES
     ):
         errors.append(
             "Field 'url' must be an absolute URL starting with http:// or https://."
@@ -40,11 +69,12 @@ def validate_agent_card(card_data: dict[str, Any]) -> list[str]:
         errors.append("Field 'capabilities' must be an object.")
 
     # Check if defaultInputModes and defaultOutputModes are arrays of strings
-    for field in ['defaultInputModes', 'defaultOutputModes']:
+    for field in _AGENT_CARD_MODE_FIELDS:
         if field in card_data:
-            if not isinstance(card_data[field], list):
+            modes = card_data[field]
+            if not isinstance(modes, list):
                 errors.append(f"Field '{field}' must be an array of strings.")
-            elif not all(isinstance(item, str) for item in card_data[field]):
+            elif not all(map(_is_str, modes)):
                 errors.append(f"All items in '{field}' must be strings.")
 
     # Check skills array
@@ -61,67 +91,62 @@ def validate_agent_card(card_data: dict[str, Any]) -> list[str]:
     return errors
 
 
-def _validate_task(data: dict[str, Any]) -> list[str]:
+def _validate_task(task: Task) -> Sequence[str]:
+    if task.id and task.status.state:
+        return _NO_ERRORS
     errors = []
-    if 'id' not in data:
+    if not task.id:
         errors.append("Task object missing required field: 'id'.")
-    if 'status' not in data or 'state' not in data.get('status', {}):
+    if not task.status.state:
         errors.append("Task object missing required field: 'status.state'.")
     return errors
 
 
-def _validate_status_update(data: dict[str, Any]) -> list[str]:
-    errors = []
-    if 'status' not in data or 'state' not in data.get('status', {}):
-        errors.append(
-            "StatusUpdate object missing required field: 'status.state'."
-        )
-    return errors
+def _validate_status_update(event: TaskStatusUpdateEvent) -> Sequence[str]:
+    if event.status.state:
+        return _NO_ERRORS
+    return ("StatusUpdate object missing required field: 'status.state'.",)
 
 
-def _validate_artifact_update(data: dict[str, Any]) -> list[str]:
-    errors = []
-    if 'artifact' not in data:
-        errors.append(
-            "ArtifactUpdate object missing required field: 'artifact'."
-        )
-    elif (
-        'parts' not in data.get('artifact', {})
-        or not isinstance(data.get('artifact', {}).get('parts'), list)
-        or not data.get('artifact', {}).get('parts')
-    ):
-        errors.append("Artifact object must have a non-empty 'parts' array.")
-    return errors
+def _validate_artifact_update(
+    event: TaskArtifactUpdateEvent,
+) -> Sequence[str]:
+    if event.artifact.parts:
+        return _NO_ERRORS
+    return ("Artifact object must have a non-empty 'parts' array.",)
 
 
-def _validate_message(data: dict[str, Any]) -> list[str]:
+def _validate_message(message: Message) -> Sequence[str]:
+    has_parts = bool(message.parts)
+    from_agent = message.role == Role.agent
+    if has_parts and from_agent:
+        return _NO_ERRORS
     errors = []
-    if (
-        'parts' not in data
-        or not isinstance(data.get('parts'), list)
-        or not data.get('parts')
-    ):
+    if not has_parts:
         errors.append("Message object must have a non-empty 'parts' array.")
-    if 'role' not in data or data.get('role') != 'agent':
+    if not from_agent:
         errors.append("Message from agent must have 'role' set to 'agent'.")
     return errors
 
 
-def validate_message(data: dict[str, Any]) -> list[str]:
-    """Validate an incoming message from the agent based on its kind."""
-    if 'kind' not in data:
-        return ["Response from agent is missing required 'kind' field."]
+_EVENT_VALIDATORS: dict[type, Callable[[Any], Sequence[str]]] = {
+    Task: _validate_task,
+    TaskStatusUpdateEvent: _validate_status_update,
+    TaskArtifactUpdateEvent: _validate_artifact_update,
+    Message: _validate_message,
+}
+
 
-    kind = data.get('kind')
-    validators = {
-        'task': _validate_task,
-        'status-update': _validate_status_update,
-        'artifact-update': _validate_artifact_update,
-        'message': _validate_message,
-    }
+def validate_event(
+    event: Task | Message | TaskStatusUpdateEvent | TaskArtifactUpdateEvent,
+) -> Sequence[str]:
+    """Validate an event received from the agent based on its kind.
 
-    validator = validators.get(str(kind))
+    The checks read the parsed event model directly; pydantic has already
+    enforced the field types, so only the A2A-specific rules remain.
+    """
+    validator = _EVENT_VALIDATORS.get(type(event))
     if validator:
-        return validator(data)
+        return validator(event)
 
-    return [f"Unknown message kind received: '{kind}'."]
+    return [f"Unknown message kind received: '{event.kind}'."]
@@ -15,12 +15,24 @@ interface AgentResponseEvent {
     validation_errors: string[];
 }
 
+// The backend sends the agent's event verbatim under 'result', alongside the
+// metadata it computed for it.
+interface AgentResponseEnvelope {
+    id: string;
+    error?: string;
+    validation_errors?: string[];
+    result?: Omit<AgentResponseEvent, 'id' | 'error' | 'validation_errors'>;
+}
+
 interface DebugLog {
     type: 'request' | 'response' | 'error' | 'validation_error';
     data: any;
     id: string;
 }
 
+// Each batched event arrives as an [event name, data] pair.
+type BatchedEvent = [event: string, data: any];
+
 // Declare hljs global from CDN
 declare global {
     interface Window {
@@ -31,6 +43,29 @@ declare global {
 document.addEventListener('DOMContentLoaded', () => {
     const socket = io();
 
+    // The backend coalesces its events into 'batch' frames; dispatch each
+    // entry to the handler registered for its event name.
+    const batchHandlers: { [event: string]: (data: any) => void } = {};
+    const onBatched = (event: string, handler: (data: any) => void) => {
+        batchHandlers[event] = handler;
+    };
+    // Each batch is acknowledged once handled; the backend stops sending when
+    // too many batches are unacknowledged. A failing handler must neither
+    // hold back the acknowledgement nor the rest of the batch.
+    socket.on('batch', (events: BatchedEvent[], ack: () => void) => {
+        try {
+            events.forEach(([event, data]) => {
+                try {
+                    batchHandlers[event]?.(data);
+                } catch (error) {
+                    console.error(`Error handling '${event}' event:`, error);
+                }
+            });
+        } finally {
+            ack();
+        }
+    });
+
     const connectBtn = document.getElementById('connect-btn') as HTMLButtonElement;
     const agentUrlInput = document.getElementById('agent-url') as HTMLInputElement;
     const collapsibleHeader = document.querySelector('.collapsible-header') as HTMLElement;
@@ -117,9 +152,16 @@ document.addEventListener('DOMContentLoaded', () => {
         Object.keys(rawLogStore).forEach(key => delete rawLogStore[key]);
     });
 
+    // The backend only sends debug logs while the console is open.
+    const syncDebugSubscription = () => {
+        socket.emit('enable_debug', { enabled: !debugConsole.classList.contains('hidden') });
+    };
+    socket.on('connect', syncDebugSubscription);
+
     toggleConsoleBtn.addEventListener('click', () => {
         const isHidden = debugConsole.classList.toggle('hidden');
         toggleConsoleBtn.textContent = isHidden ? 'Show' : 'Hide';
+        syncDebugSubscription();
     });
     
     modalCloseBtn.addEventListener('click', () => jsonModal.classList.add('hidden'));
@@ -179,7 +221,7 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    socket.on('client_initialized', (data: { status: string, message?: string }) => {
+    onBatched('client_initialized', (data: { status: string, message?: string }) => {
         if (data.status === 'success') {
             chatInput.disabled = false;
             sendBtn.disabled = false;
@@ -207,7 +249,13 @@ document.addEventListener('DOMContentLoaded', () => {
         if (e.key === 'Enter') sendMessage();
     });
 
-    socket.on('agent_response', (event: AgentResponseEvent) => {
+    onBatched('agent_response', ({ result, ...meta }: AgentResponseEnvelope) => {
+        const event = { ...result, ...meta } as AgentResponseEvent;
+        // The backend does not send a separate debug log for agent responses;
+        // the console entry is derived from the response itself.
+        if (result) {
+            appendDebugLog({ type: 'response', data: result, id: meta.id });
+        }
         const displayMessageId = `display-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
         messageJsonStore[displayMessageId] = event;
 
@@ -259,7 +307,15 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    socket.on('debug_log', (log: DebugLog) => {
+    // Logs are always stored for the chat's JSON view, but only rendered while
+    // the debug console is open.
+    const appendDebugLog = (log: DebugLog) => {
+        if (!rawLogStore[log.id]) {
+            rawLogStore[log.id] = {};
+        }
+        rawLogStore[log.id][log.type] = log.data;
+        if (debugConsole.classList.contains('hidden')) return;
+
         const logEntry = document.createElement('div');
         const timestamp = new Date().toLocaleTimeString();
         
@@ -275,13 +331,9 @@ document.addEventListener('DOMContentLoaded', () => {
             <pre>${jsonString}</pre>
         `;
         debugContent.appendChild(logEntry);
-        
-        if (!rawLogStore[log.id]) {
-            rawLogStore[log.id] = {};
-        }
-        rawLogStore[log.id][log.type] = log.data;
         debugContent.scrollTop = debugContent.scrollHeight;
-    });
+    };
+    onBatched('debug_log', appendDebugLog);
     
     function appendMessage(sender: string, content: string, messageId: string, isHtml: boolean = false, validationErrors: string[] = []) {
         const placeholder = chatMessages.querySelector('.placeholder-text');